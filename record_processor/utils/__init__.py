@@ -2,9 +2,57 @@
 # Licensed under the MIT License.
 
 
+import functools
 import zipfile
 import json
 import os
+import shutil
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=32)
+def _open_zip_cached(zip_file_path: str, mtime_ns: int, size: int) -> zipfile.ZipFile:
+    """
+    Open a ZipFile handle, cached so repeated reads of the same archive do
+    not reparse the central directory. The modification time and size are
+    part of the key so a replaced archive gets a fresh handle instead of
+    stale cached data.
+    :param zip_file_path: The path of the zip file.
+    :param mtime_ns: The file's st_mtime_ns at lookup time.
+    :param size: The file's st_size at lookup time.
+    :return: The open ZipFile handle.
+    """
+    return zipfile.ZipFile(zip_file_path, 'r')
+
+
+def _open_zip(zip_file_path: str) -> zipfile.ZipFile:
+    """
+    Get a cached ZipFile handle for the archive, reopening it if the file
+    on disk has changed since it was cached.
+    :param zip_file_path: The path of the zip file.
+    :return: The open ZipFile handle.
+    """
+    stat = os.stat(zip_file_path)
+    return _open_zip_cached(zip_file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _first_file_member(zip_ref: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """
+    Get the first non-directory member of the archive. Archives built by
+    zipping a folder list the folder entry first, so namelist()[0] may name
+    a directory rather than the data file.
+    :param zip_ref: The open ZipFile handle.
+    :return: The first file member of the archive.
+    """
+    for info in zip_ref.infolist():
+        if not info.is_dir():
+            return info
+    raise ValueError(f"No file members found in zip archive: {zip_ref.filename!r}")
 
 
 def unzip_and_read_file(file_path: str) -> str:
@@ -13,10 +61,50 @@ def unzip_and_read_file(file_path: str) -> str:
     file_path: the path of the pending zip file.
     return: the content of the extracted file.
     """
-    extracted_file = unzip_file(file_path)
-    with open(extracted_file, 'r', encoding='utf-8') as file:
-        content = file.read()
-    return content
+    zip_ref = _open_zip(file_path)
+    return zip_ref.read(_first_file_member(zip_ref)).decode('utf-8')
+
+
+def unzip_and_load_json(file_path: str) -> Any:
+    """
+    Unzip the file and parse the content of the extracted file as JSON.
+    file_path: the path of the pending zip file.
+    return: the parsed JSON object.
+    """
+    zip_ref = _open_zip(file_path)
+    content = zip_ref.read(_first_file_member(zip_ref))
+
+    # orjson parses bytes directly, skipping the UTF-8 decode pass that
+    # unzip_and_read_file pays for callers that only want the JSON object.
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _resolve_member_path(folder_name: str, member_name: str) -> str:
+    """
+    Resolve an archive member name to a target path inside the extraction
+    folder. Member names come straight from the archive and may contain
+    absolute or ``..`` components; verify the resolved path stays inside the
+    folder, matching the sanitization ``extractall`` performs.
+    :param folder_name: The extraction folder.
+    :param member_name: The member name from the archive.
+    :return: The resolved target path.
+    """
+    target_path = os.path.join(folder_name, member_name)
+    folder_root = os.path.abspath(folder_name)
+    resolved_path = os.path.abspath(target_path)
+    try:
+        common = os.path.commonpath([folder_root, resolved_path])
+    except ValueError:
+        # Different drives on Windows -> definitely outside the folder.
+        common = ""
+    if common != folder_root or resolved_path == folder_root:
+        raise ValueError(
+            f"Unsafe zip member {member_name!r}: resolved path "
+            f"{resolved_path!r} escapes extraction folder {folder_root!r}"
+        )
+    return target_path
 
 
 def unzip_file(zip_file_path: str) -> str:
@@ -27,32 +115,64 @@ def unzip_file(zip_file_path: str) -> str:
     """
     folder_name = os.path.splitext(zip_file_path)[0]
 
-    # Create the directory if it doesn't exist
-    if not os.path.exists(folder_name):
-        os.makedirs(folder_name)
-
-    # Extract the contents of the ZIP file into the directory
     with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-        zip_ref.extractall(folder_name)
+        extracted_file = _resolve_member_path(
+            folder_name, _first_file_member(zip_ref).filename
+        )
+
+        # Fast path: if the archive's first file member already exists on disk
+        # from a previous run, reuse it instead of decompressing every member
+        # again. Checking for the member itself (not just a non-empty folder)
+        # guards against half-written folders from interrupted extractions.
+        if os.path.isfile(extracted_file):
+            return extracted_file
+
+        # Create the directory if it doesn't exist
+        os.makedirs(folder_name, exist_ok=True)
+
+        # Extract the contents of the ZIP file into the directory, copying each
+        # member with a large buffer to reduce the number of read/write calls.
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            target_path = _resolve_member_path(folder_name, info.filename)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            if info.compress_type == zipfile.ZIP_STORED:
+                # Stored members need no inflation; copy the raw bytes in one go.
+                with open(target_path, 'wb') as dst:
+                    dst.write(zip_ref.read(info))
+            else:
+                with zip_ref.open(info) as src, open(target_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
 
-    extracted_file = os.path.join(folder_name, os.listdir(folder_name)[0])
     return extracted_file
 
 
-def save_to_json(data: dict, output_file_path: str):
+def save_to_json(data: dict, output_file_path: str, pretty: bool = False):
     """
     Save the data to a JSON file.
     data: the data to save.
     output_file_path: the path of the output file.
+    pretty: whether to indent the output for human readers.
     """
 
-    # Extract the directory path from the file path
+    # Extract the directory path from the file path; it is empty when the
+    # output path has no directory component.
     directory = os.path.dirname(output_file_path)
-    
-    create_folder(directory)
 
-    with open(output_file_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    if directory:
+        create_folder(directory)
+
+    with open(output_file_path, 'wb', buffering=1 << 20) as file:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            file.write(orjson.dumps(data, option=option))
+        elif pretty:
+            file.write(json.dumps(data, indent=4).encode('utf-8'))
+        else:
+            file.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
         
         
 def create_folder(folder_path: str):
@@ -61,8 +181,7 @@ def create_folder(folder_path: str):
 
     :param folder_path: The path of the folder to create.
     """
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+    os.makedirs(folder_path, exist_ok=True)
         
 def json_parser(json_string:str):
     """
@@ -6,7 +6,8 @@ import json
 import logging
 import os
 import platform
-from typing import List, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from config.config_loader import get_ufo_config
 from ufo.module.basic import BaseSession
@@ -24,6 +25,16 @@ from ufo.module.sessions.linux_session import LinuxSession, LinuxServiceSession
 from ufo.module.sessions.mobile_session import MobileSession, MobileServiceSession
 
 ufo_config = get_ufo_config()
+_EVA_SESSION = ufo_config.system.eva_session
+
+# Recognized plan-file extensions; a tuple so str.endswith matches all of them
+# in a single C-level call.
+_PLAN_SUFFIXES = (".json",)
+
+# Local bindings skip the os.path attribute lookups when deriving session
+# names for large plan batches.
+_basename = os.path.basename
+_splitext = os.path.splitext
 
 
 class SessionPool:
@@ -128,7 +139,7 @@ class SessionFactory:
             return [
                 Session(
                     task,
-                    ufo_config.system.eva_session,
+                    _EVA_SESSION,
                     id=kwargs.get("id", 0),
                     request=request,
                     mode=mode,
@@ -139,7 +150,7 @@ class SessionFactory:
             return [
                 ServiceSession(
                     task=task,
-                    should_evaluate=ufo_config.system.eva_session,
+                    should_evaluate=_EVA_SESSION,
                     id=kwargs.get("id", 0),
                     request=request,
                     task_protocol=kwargs.get("task_protocol"),
@@ -154,7 +165,7 @@ class SessionFactory:
                 return self.create_follower_session_in_batch(task, plan)
             else:
                 return [
-                    FollowerSession(task, plan, ufo_config.system.eva_session, id=0)
+                    FollowerSession(task, plan, _EVA_SESSION, id=0)
                 ]
         elif mode == "batch_normal":
             self.logger.info(
@@ -165,13 +176,13 @@ class SessionFactory:
                 return self.create_sessions_in_batch(task, plan)
             else:
                 return [
-                    FromFileSession(task, plan, ufo_config.system.eva_session, id=0)
+                    FromFileSession(task, plan, _EVA_SESSION, id=0)
                 ]
         elif mode == "operator":
             self.logger.info(f"Creating a Windows operator session for mode: {mode}")
             return [
                 OpenAIOperatorSession(
-                    task, ufo_config.system.eva_session, id=0, request=request
+                    task, _EVA_SESSION, id=0, request=request
                 )
             ]
         else:
@@ -196,7 +207,7 @@ class SessionFactory:
             return [
                 LinuxSession(
                     task=task,
-                    should_evaluate=ufo_config.system.eva_session,
+                    should_evaluate=_EVA_SESSION,
                     id=0,
                     request=request,
                     mode=mode,
@@ -208,7 +219,7 @@ class SessionFactory:
             return [
                 LinuxServiceSession(
                     task=task,
-                    should_evaluate=ufo_config.system.eva_session,
+                    should_evaluate=_EVA_SESSION,
                     id=0,
                     request=request,
                     task_protocol=kwargs.get("task_protocol"),
@@ -241,7 +252,7 @@ class SessionFactory:
             return [
                 MobileSession(
                     task=task,
-                    should_evaluate=ufo_config.system.eva_session,
+                    should_evaluate=_EVA_SESSION,
                     id=0,
                     request=request,
                     mode=mode,
@@ -252,7 +263,7 @@ class SessionFactory:
             return [
                 MobileServiceSession(
                     task=task,
-                    should_evaluate=ufo_config.system.eva_session,
+                    should_evaluate=_EVA_SESSION,
                     id=0,
                     request=request,
                     task_protocol=kwargs.get("task_protocol"),
@@ -330,16 +341,22 @@ class SessionFactory:
         :return: The list of created follower sessions.
         """
         plan_files = self.get_plan_files(plan)
-        file_names = [self.get_file_name_without_extension(f) for f in plan_files]
-        sessions = [
-            FollowerSession(
-                f"{task}/{file_name}",
+        if not plan_files:
+            return []
+
+        def build_session(indexed_plan: Tuple[int, str]) -> FollowerSession:
+            i, plan_file = indexed_plan
+            return FollowerSession(
+                f"{task}/{self.get_file_name_without_extension(plan_file)}",
                 plan_file,
-                ufo_config.system.eva_session,
+                _EVA_SESSION,
                 id=i,
             )
-            for i, (file_name, plan_file) in enumerate(zip(file_names, plan_files))
-        ]
+
+        # Each session reads and parses its own plan file, so construct them
+        # concurrently; the result order follows plan_files.
+        with ThreadPoolExecutor(max_workers=min(32, len(plan_files))) as executor:
+            sessions = list(executor.map(build_session, enumerate(plan_files)))
 
         return sessions
 
@@ -360,11 +377,10 @@ class SessionFactory:
             )
             if not os.path.exists(file_path):
                 self.task_done = {f: False for f in file_names}
-                json.dump(
-                    self.task_done,
-                    open(file_path, "w"),
-                    indent=4,
-                )
+                with open(file_path, "wb") as status_file:
+                    status_file.write(
+                        json.dumps(self.task_done, indent=4).encode("utf-8")
+                    )
             else:
                 self.task_done = json.load(open(file_path, "r"))
                 is_done_files = [f for f in file_names if self.task_done.get(f, False)]
@@ -373,7 +389,7 @@ class SessionFactory:
             FromFileSession(
                 f"{task}/{file_name}",
                 plan_file,
-                ufo_config.system.eva_session,
+                _EVA_SESSION,
                 id=i,
             )
             for i, (file_name, plan_file) in enumerate(zip(file_names, plan_files))
@@ -398,7 +414,12 @@ class SessionFactory:
         :param path: The path of the folder.
         :return: The plan files in the folder.
         """
-        return [os.path.join(path, f) for f in os.listdir(path) if f.endswith(".json")]
+        with os.scandir(path) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(_PLAN_SUFFIXES) and entry.is_file()
+            ]
 
     def get_file_name_without_extension(self, file_path: str) -> str:
         """
@@ -406,4 +427,4 @@ class SessionFactory:
         :param file_path: The path of the file.
         :return: The file name without extension.
         """
-        return os.path.splitext(os.path.basename(file_path))[0]
+        return _splitext(_basename(file_path))[0]
@@ -36,6 +36,10 @@ from ufo.module.sessions.platform_session import WindowsBaseSession
 from ufo.trajectory.parser import Trajectory
 
 ufo_config = get_ufo_config()
+
+# Evaluation flags are constant for the lifetime of the process; hoist them
+# out of the per-round config lookups.
+_EVA_ROUND = ufo_config.system.eva_round
 console = Console()
 
 
@@ -122,7 +126,7 @@ class Session(WindowsBaseSession):
             request=request,
             agent=self._host_agent,
             context=self.context,
-            should_evaluate=ufo_config.system.eva_round,
+            should_evaluate=_EVA_ROUND,
             id=self.total_rounds,
         )
 
@@ -222,7 +226,7 @@ class FollowerSession(WindowsBaseSession):
             request=request,
             agent=agent,
             context=self.context,
-            should_evaluate=ufo_config.system.eva_round,
+            should_evaluate=_EVA_ROUND,
             id=self.total_rounds,
         )
 
@@ -305,7 +309,7 @@ class FromFileSession(WindowsBaseSession):
             request=request,
             agent=self._host_agent,
             context=self.context,
-            should_evaluate=ufo_config.system.eva_round,
+            should_evaluate=_EVA_ROUND,
             id=self.total_rounds,
         )
 